@@ -80,8 +80,12 @@ def register_routes(app):
 
     # PUT /asap/<asap_id>/status - update assignment status
     @app.put("/asap/<asap_id>/status", authz="AUTH")
-    def update_asap_status(asap_id: str, auth: model.CurrentAuth, status: str):
-        """Update assignment status. Different permissions for different status changes."""
+    def update_asap_status(asap_id: str, auth: model.CurrentAuth, status: str, started_at: str|None = None):
+        """Update assignment status. Different permissions for different status changes.
+
+        Admins may also backdate the start with *started_at*, so that hourly
+        payments can be checked without waiting for real time to pass.
+        """
         try:
             uuid.UUID(asap_id)
         except ValueError:
@@ -119,21 +123,31 @@ def register_routes(app):
             if not auth.is_admin:  # pragma: no cover
                 return {"error": "Only admin can revert to active status"}, 403
 
+        start_dt = None
+        if started_at is not None:
+            fsa.checkVal(auth.is_admin, "Only admin can set started_at", 403)
+            fsa.checkVal(status == 'in_progress', "started_at requires status in_progress", 400)
+            try:
+                start_dt = datetime.datetime.fromisoformat(started_at.replace('Z', '+00:00'))
+            except ValueError:
+                fsa.checkVal(False, "Invalid started_at format", 400)
+
         now = datetime.datetime.now(datetime.timezone.utc)
-        started_at = now if status == 'in_progress' and asap['started_at'] is None else None
+        if start_dt is None and status == 'in_progress' and asap['started_at'] is None:
+            start_dt = now
         completed_at = now if status == 'completed' else None
 
         db.update_asap_status(
             asap_id=asap_id,
             status=status,
-            started_at=started_at,
+            started_at=start_dt,
             completed_at=completed_at
         )
 
         # NOTE: For completed status, payment is now handled by the dual-confirmation endpoint
         # The status endpoint is for admin use or other status changes
 
-        return "", 204
+        return fsa.jsonify(db.get_asap_by_id(asap_id=asap_id)), 200
 
     # POST /asap/<asap_id>/confirm - confirm ASAP completion (dual confirmation required)
     @app.post("/asap/<asap_id>/confirm", authz="AUTH")
@@ -261,14 +275,16 @@ def register_routes(app):
             return fsa.jsonify({
                 "status": "completed",
                 "message": "Assignment completed successfully",
-                "deleted_thread_id": deleted_thread_id
+                "deleted_thread_id": deleted_thread_id,
+                "asap": db.get_asap_by_id(asap_id=asap_id)
             }), 200
         else:
             # Waiting for other party
             other_party = "owner" if is_worker else "worker"
             return fsa.jsonify({
                 "status": "pending_confirmation",
-                "message": f"Confirmation recorded. Waiting for {other_party} to confirm."
+                "message": f"Confirmation recorded. Waiting for {other_party} to confirm.",
+                "asap": db.get_asap_by_id(asap_id=asap_id)
             }), 200
 
     # DELETE /asap/<asap_id> - cancel/delete assignment (owner/admin only)
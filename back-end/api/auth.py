@@ -42,7 +42,8 @@ def register_routes(app):
             user_id=None
         )
         fsa.checkVal(aid, "User with this username, email, or phone already exists", 409)
-        return fsa.jsonify({"user_id": aid}), 201
+        # also hand out a token, so that a new user does not need to login right away
+        return fsa.jsonify({"user_id": aid, "token": app.create_token(username.strip())}), 201
 
     # GET /login
     # NOTE: This MUST be OPEN so users can get tokens; authn="basic" checks credentials
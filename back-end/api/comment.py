@@ -121,7 +121,7 @@ def register_routes(app):
             return {"error": "Not authorized to edit this comment"}, 403
 
         db.update_comment(comment_id=comment_id, content=content.strip())
-        return "", 204
+        return fsa.jsonify(db.get_comment_by_id(comment_id=comment_id)), 200
 
     # DELETE /comments/<comment_id> - delete a comment
     @app.delete("/comments/<comment_id>", authz="AUTH")
@@ -228,7 +228,9 @@ def register_routes(app):
             parent_id=comment_id
         )
 
-        return fsa.jsonify({"comment_id": reply_id}), 201
+        # Include the parent's updated reply count, which changed with this reply
+        parent = db.get_comment_by_id(comment_id=comment_id)
+        return fsa.jsonify({"comment_id": reply_id, "parent_reply_count": parent['reply_count']}), 201
 
     # ============================================
     # CONVENIENCE: GET COMMENT WITH REPLIES
@@ -126,9 +126,13 @@ def register_routes(app):
                 title_search=title_search
             ))
 
-        # For each paps, include categories (but NOT media - use separate endpoint)
+        # Include categories of all paps with one query (but NOT media - use separate endpoint)
+        categories: dict[str, list] = {pap['id']: [] for pap in paps}
+        if categories:
+            for cat in db.get_paps_categories_batch(paps_ids=list(categories)):
+                categories[cat.pop('paps_id')].append(cat)
         for pap in paps:
-            pap['categories'] = list(db.get_paps_categories(paps_id=str(pap['id'])))
+            pap['categories'] = categories[pap['id']]
 
         return fsa.jsonify({"paps": paps, "total_count": len(paps)}), 200
 
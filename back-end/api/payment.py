@@ -187,3 +187,19 @@ def register_routes(app):
 
         db.delete_payment(payment_id=payment_id)
         return "", 204
+
+    # DELETE /paps/<paps_id>/payments - delete all payments of a job posting (admin only)
+    @app.delete("/paps/<paps_id>/payments", authz="ADMIN")
+    def delete_paps_payments(paps_id: str, auth: model.CurrentAuth):
+        """Delete all payments of a job posting, whatever their status. Admin only."""
+        try:
+            uuid.UUID(paps_id)
+        except ValueError:
+            return {"error": "Invalid PAPS ID format"}, 400
+
+        paps = db.get_paps_by_id_admin(id=paps_id)
+        if not paps:
+            return {"error": "Job posting not found"}, 404
+
+        db.delete_payments_for_paps(paps_id=paps_id)
+        return "", 204
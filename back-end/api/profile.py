@@ -195,37 +195,38 @@ def register_routes(app):
                         end_date: str|None = None, is_current: bool = False,
                         display_order: int|None = None):
         """Add work experience to current user's profile."""
-        fsa.checkVal(len(title.strip()) >= 2, "Title must be at least 2 characters", 400)  # pragma: no cover
-        # Validate dates
-        fsa.checkVal(start_date is not None, "Start date is required", 400)  # pragma: no cover
-        assert start_date is not None
-        try:
-            start_dt = datetime.datetime.fromisoformat(start_date.replace('Z', '+00:00'))
-        except ValueError:  # pragma: no cover
-            fsa.checkVal(False, "Invalid start_date format", 400)
-            raise  # Never reached but helps type checker
-        end_dt = None
-        if end_date:
-            try:
-                end_dt = datetime.datetime.fromisoformat(end_date.replace('Z', '+00:00'))
-                fsa.checkVal(end_dt >= start_dt, "End date must be after start date", 400)
-            except ValueError:
-                fsa.checkVal(False, "Invalid end_date format", 400)
-        fsa.checkVal(not is_current or end_date is None, "Current experiences cannot have end date", 400)
-        # Validate display_order if provided
-        if display_order is not None:
-            fsa.checkVal(display_order >= 0, "Display order must be non-negative", 400)
-        exp_id = db.insert_user_experience(
-            user_id=auth.aid,
-            title=title.strip(),
-            company=company.strip() if company else None,
-            description=description.strip() if description else None,
-            start_date=start_dt,
-            end_date=end_dt,
-            is_current=is_current,
-            display_order=display_order
-        )
+        experience = _check_experience(title, company, description, start_date, end_date,
+                                       is_current, display_order)
+        exp_id = db.insert_user_experience(user_id=auth.aid, **experience)
         return fsa.jsonify({"experience_id": exp_id}), 201
+    # POST /profile/experiences/batch - add several experiences to current user
+
+    @app.post("/profile/experiences/batch", authz="AUTH")
+    def post_experiences_batch(auth: model.CurrentAuth, items: list):
+        """Add several work experiences to current user's profile in one transaction."""
+        fsa.checkVal(len(items) > 0, "At least one experience is required", 400)
+        experiences = []
+        for item in items:
+            fsa.checkVal(isinstance(item, dict) and isinstance(item.get("title"), str),
+                         "Each experience must be an object with a title", 400)
+            # items are not typed by the framework, check them as the single route would
+            for field in ("company", "description", "start_date", "end_date"):
+                fsa.checkVal(item.get(field) is None or isinstance(item[field], str),
+                             f"Experience {field} must be a string", 400)
+            fsa.checkVal(isinstance(item.get("is_current", False), bool),
+                         "Experience is_current must be a boolean", 400)
+            display_order = item.get("display_order")
+            fsa.checkVal(display_order is None or
+                         isinstance(display_order, int) and not isinstance(display_order, bool),
+                         "Experience display_order must be an integer", 400)
+            experiences.append(_check_experience(
+                item["title"], item.get("company"), item.get("description"),
+                item.get("start_date"), item.get("end_date"),
+                item.get("is_current", False), display_order
+            ))
+        # all items are validated before any insert, the request is a single transaction
+        exp_ids = [db.insert_user_experience(user_id=auth.aid, **exp) for exp in experiences]
+        return fsa.jsonify([{"experience_id": exp_id} for exp_id in exp_ids]), 201
     # PATCH /profile/experiences/<exp_id> - update experience
 
     @app.patch("/profile/experiences/<exp_id>", authz="AUTH")
@@ -235,9 +236,12 @@ def register_routes(app):
                          is_current: bool|None = None, display_order: int|None = None):
         """Update a work experience."""
         try:
-            uuid.UUID(exp_id)
+            exp_uuid = uuid.UUID(exp_id)
         except ValueError:
             return {"error": "Invalid experience ID format"}, 400
+        # The nil UUID is never allocated, skip the lookup
+        if exp_uuid.int == 0:
+            return {"error": "Experience not found"}, 404
         # Check ownership
         exp = db.get_user_experience_by_id(exp_id=exp_id)
         if not exp:  # pragma: no cover
@@ -280,9 +284,12 @@ def register_routes(app):
     def delete_experience(exp_id: str, auth: model.CurrentAuth):
         """Delete a work experience."""
         try:
-            uuid.UUID(exp_id)
+            exp_uuid = uuid.UUID(exp_id)
         except ValueError:
             return {"error": "Invalid experience ID format"}, 400
+        # The nil UUID is never allocated, skip the lookup
+        if exp_uuid.int == 0:
+            return {"error": "Experience not found"}, 404
         # Check ownership
         exp = db.get_user_experience_by_id(exp_id=exp_id)
         if not exp:  # pragma: no cover
@@ -306,26 +313,37 @@ def register_routes(app):
     @app.post("/profile/interests", authz="AUTH")
     def post_interest(auth: model.CurrentAuth, category_id: str, proficiency_level: int = 1):
         """Add an interest to current user's profile."""
-        try:
-            uuid.UUID(category_id)
-        except ValueError:  # pragma: no cover
-            return {"error": "Invalid category_id format"}, 400
-        fsa.checkVal(1 <= proficiency_level <= 5, "Proficiency level must be 1-5", 400)
-        # Check category exists
-        category = db.get_category_by_id(category_id=category_id)
-        if not category:
-            return {"error": "Category not found"}, 404
-        # Check if user already has this interest
-        existing_interests = db.get_user_interests(user_id=auth.aid)
-        for interest in existing_interests:
-            if interest["category_id"] == category_id:
-                return {"error": "Interest already exists"}, 409
+        _check_interest(auth.aid, category_id, proficiency_level)
         db.insert_user_interest(
             user_id=auth.aid,
             category_id=category_id,
             proficiency_level=proficiency_level
         )
         return "", 201
+    # POST /profile/interests/batch - add several interests to current user
+
+    @app.post("/profile/interests/batch", authz="AUTH")
+    def post_interests_batch(auth: model.CurrentAuth, items: list):
+        """Add several interests to current user's profile in one transaction."""
+        fsa.checkVal(len(items) > 0, "At least one interest is required", 400)
+        seen: set[str] = set()
+        for item in items:
+            fsa.checkVal(isinstance(item, dict) and isinstance(item.get("category_id"), str),
+                         "Each interest must be an object with a category_id", 400)
+            proficiency_level = item.get("proficiency_level", 1)
+            fsa.checkVal(isinstance(proficiency_level, int) and not isinstance(proficiency_level, bool),
+                         "Proficiency level must be an integer", 400)
+            _check_interest(auth.aid, item["category_id"], proficiency_level)
+            fsa.checkVal(item["category_id"] not in seen, "Interest already exists", 409)
+            seen.add(item["category_id"])
+        # all items are validated before any insert, the request is a single transaction
+        for item in items:
+            db.insert_user_interest(
+                user_id=auth.aid,
+                category_id=item["category_id"],
+                proficiency_level=item.get("proficiency_level", 1)
+            )
+        return "", 201
     # PATCH /profile/interests/<category_id> - update interest
 
     @app.patch("/profile/interests/<category_id>", authz="AUTH")
@@ -453,3 +471,50 @@ def register_routes(app):
         if gender is not None:
             fsa.checkVal(gender in ('M', 'F', 'O', 'N'),
                          "Invalid gender. Must be M, F, O, or N", 400)
+
+    def _check_experience(title, company, description, start_date, end_date, is_current, display_order):
+        """Validate experience parameters and return insert arguments."""
+        fsa.checkVal(len(title.strip()) >= 2, "Title must be at least 2 characters", 400)  # pragma: no cover
+        # Validate dates
+        fsa.checkVal(start_date is not None, "Start date is required", 400)  # pragma: no cover
+        assert start_date is not None
+        try:
+            start_dt = datetime.datetime.fromisoformat(start_date.replace('Z', '+00:00'))
+        except ValueError:  # pragma: no cover
+            fsa.checkVal(False, "Invalid start_date format", 400)
+            raise  # Never reached but helps type checker
+        end_dt = None
+        if end_date:
+            try:
+                end_dt = datetime.datetime.fromisoformat(end_date.replace('Z', '+00:00'))
+                fsa.checkVal(end_dt >= start_dt, "End date must be after start date", 400)
+            except ValueError:
+                fsa.checkVal(False, "Invalid end_date format", 400)
+        fsa.checkVal(not is_current or end_date is None, "Current experiences cannot have end date", 400)
+        # Validate display_order if provided
+        if display_order is not None:
+            fsa.checkVal(display_order >= 0, "Display order must be non-negative", 400)
+        return {
+            "title": title.strip(),
+            "company": company.strip() if company else None,
+            "description": description.strip() if description else None,
+            "start_date": start_dt,
+            "end_date": end_dt,
+            "is_current": is_current,
+            "display_order": display_order,
+        }
+
+    def _check_interest(user_id, category_id, proficiency_level):
+        """Validate a new interest for a user, aborting on errors."""
+        try:
+            uuid.UUID(category_id)
+        except ValueError:  # pragma: no cover
+            fsa.checkVal(False, "Invalid category_id format", 400)
+        fsa.checkVal(1 <= proficiency_level <= 5, "Proficiency level must be 1-5", 400)
+        # Check category exists
+        category = db.get_category_by_id(category_id=category_id)
+        fsa.checkVal(category, "Category not found", 404)
+        # Check if user already has this interest
+        existing_interests = db.get_user_interests(user_id=user_id)
+        fsa.checkVal(all(i["category_id"] != category_id for i in existing_interests),
+                     "Interest already exists", 409)
@@ -339,7 +339,10 @@ def register_routes(app):
         if error:  # pragma: no cover
             return {"error": error}, 400
 
-        return fsa.jsonify({"asap_id": asap_id}), 200
+        # Return the refreshed application so callers need not fetch it again
+        spap = db.get_spap_by_id(spap_id=spap_id)
+        spap['asap_id'] = asap_id
+        return fsa.jsonify(spap), 200
 
     # PUT /spap/<spap_id>/reject - reject an application (owner only)
     @app.put("/spap/<spap_id>/reject", authz="AUTH")
@@ -379,7 +382,7 @@ def register_routes(app):
         # Update SPAP status to 'rejected'
         db.update_spap_status(spap_id=spap_id, status='rejected')
 
-        return "", 204
+        return fsa.jsonify(db.get_spap_by_id(spap_id=spap_id)), 200
 
     # ============================================
     # SPAP MEDIA MANAGEMENT
@@ -10,7 +10,7 @@
 # Configuration:
 #
 # - APP_LOGGING_LEVEL: level of logging
-# - APP_TESTING: enable testing route /uptime
+# - APP_TESTING: enable testing route /uptime and X-DB-Calls response header
 # - APP_USERS: enable /users routes for testing
 #
 
@@ -27,6 +27,7 @@ from utils import log
 # start and configure flask service
 import FlaskSimpleAuth as fsa
 from flask.json.provider import DefaultJSONProvider  # type: ignore[import-not-found]
+import orjson
 
 # Custom JSON provider to handle Decimal and other types
 class CustomJSONProvider(DefaultJSONProvider):
@@ -37,8 +38,27 @@ class CustomJSONProvider(DefaultJSONProvider):
         if isinstance(o, datetime.timedelta):
             # Convert timedelta to total seconds
             return o.total_seconds()
+        if isinstance(o, tuple):
+            # named tuples, which orjson does not serialize
+            return list(o)
         return super().default(o)
 
+    # NOTE orjson is much faster, dates still go through default() to keep their format
+    def dumps(self, obj, **kwargs):
+        if set(kwargs) - {"indent", "separators"}:  # pragma: no cover
+            return super().dumps(obj, **kwargs)
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):  # pragma: no cover
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        if kwargs:  # pragma: no cover
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
 app = fsa.Flask(os.environ["APP_NAME"], static_folder="media", static_url_path="/media")
 app.json_provider_class = CustomJSONProvider
 app.json = CustomJSONProvider(app)
@@ -418,14 +418,13 @@ CREATE TABLE COMMENT (
 -- ============================================
 
 -- User indexes
-CREATE INDEX idx_user_email ON "USER"(email);
+-- NOTE username and email lookups use the indexes of their UNIQUE constraints
 CREATE INDEX idx_user_phone ON "USER"(phone) WHERE phone IS NOT NULL;
 CREATE INDEX idx_user_role ON "USER"(role_id);
 CREATE INDEX idx_user_active ON "USER"(is_active) WHERE is_active = TRUE;
-CREATE INDEX idx_user_username ON "USER"(username);
 
 -- Profile indexes
-CREATE INDEX idx_profile_user ON USER_PROFILE(user_id);
+-- NOTE user_id lookups use the index of its UNIQUE constraint
 CREATE INDEX idx_profile_location ON USER_PROFILE(location_lat, location_lng) WHERE location_lat IS NOT NULL;
 
 -- PAPS indexes
@@ -437,8 +436,8 @@ CREATE INDEX idx_paps_location ON PAPS(location_lat, location_lng) WHERE locatio
 CREATE INDEX idx_paps_deleted ON PAPS(deleted_at) WHERE deleted_at IS NULL;
 
 -- PAPS_CATEGORY indexes
-CREATE INDEX idx_paps_category_paps ON PAPS_CATEGORY(paps_id);
-CREATE INDEX idx_paps_category_category ON PAPS_CATEGORY(category_id);
+-- NOTE paps_id lookups use the primary key, interest matching joins on category_id
+CREATE INDEX idx_paps_category_category ON PAPS_CATEGORY(category_id) INCLUDE (paps_id);
 CREATE INDEX idx_paps_category_primary ON PAPS_CATEGORY(paps_id) WHERE is_primary = TRUE;
 
 -- SPAP indexes
@@ -483,7 +482,7 @@ CREATE INDEX idx_category_active ON CATEGORY(is_active) WHERE is_active = TRUE;
 CREATE INDEX idx_category_slug ON CATEGORY(slug);
 
 -- User Interest/Experience indexes
-CREATE INDEX idx_user_interest_user ON USER_INTEREST(user_id);
+-- NOTE user_id lookups use the primary key
 CREATE INDEX idx_user_interest_category ON USER_INTEREST(category_id);
 CREATE INDEX idx_user_experience_user ON USER_EXPERIENCE(user_id);
 
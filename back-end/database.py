@@ -68,6 +68,22 @@ def db_commit(res: Response) -> Response:
         db._ret_obj()
     return res
 
+# query counts of pooled connections when last seen by db_calls
+_calls_seen: dict[int, int] = {}
+
+# testing only: report the number of queries run by the request
+# NOTE this must run before db_commit returns the connection to the pool
+def db_calls(res: Response) -> Response:
+    """Set the X-DB-Calls header to the number of queries run by this request."""
+    calls = 0
+    if db._has_obj():
+        total = sum(db._count.values())
+        seen = _calls_seen.get(db._id, 0)
+        calls = total - seen if total >= seen else total  # counters were reset
+        _calls_seen[db._id] = total
+    res.headers["X-DB-Calls"] = str(calls)
+    return res
+
 # this hook ensures that the database object is returned to the pool.
 # NOTE this runs after connection or pool errors
 def db_return(err):
@@ -102,5 +118,8 @@ def init_app(app: Flask):
     db.set(fun=lambda _i: anodb.DB(**app.config["DATABASE"]))
     # after_request may not be executed under some errors
     app.after_request(db_commit)
+    # after_request hooks run in reverse order, so this one precedes db_commit
+    if app.config.get("APP_TESTING", False):
+        app.after_request(db_calls)
     # this is always executed, whatever happened
     app.teardown_request(db_return)
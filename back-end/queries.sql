@@ -589,7 +589,7 @@ SELECT COALESCE(MAX(display_order), 0) + 1 FROM PAPS_MEDIA WHERE paps_id = :paps
 -- Get paps matched by user interests (for non-admin users)
 -- Returns paps where user has interests in the paps categories, ranked by proficiency sum
 -- name: get_paps_by_interest_match(user_id, status, category_id, lat, lng, max_distance, min_price, max_price, payment_type, owner_username, title_search, limit_count)
-SELECT DISTINCT
+SELECT
     p.id::text,
     p.owner_id::text,
     p.title,
@@ -626,7 +626,6 @@ SELECT DISTINCT
 FROM PAPS p
 JOIN "USER" u ON p.owner_id = u.id
 LEFT JOIN USER_PROFILE up ON u.id = up.user_id
-LEFT JOIN PAPS_CATEGORY pc ON p.id = pc.paps_id
 LEFT JOIN (
     -- Calculate match score: sum of user's proficiency levels for matching categories
     SELECT pc2.paps_id, SUM(ui.proficiency_level) as match_score
@@ -643,7 +642,9 @@ WHERE p.deleted_at IS NULL
     OR (p.status = 'published' AND p.is_public = TRUE AND (p.expires_at IS NULL OR p.expires_at > CURRENT_TIMESTAMP))
   )
   AND (:status::text IS NULL OR p.status = :status::text)
-  AND (:category_id::uuid IS NULL OR pc.category_id = :category_id::uuid)
+  AND (:category_id::uuid IS NULL OR EXISTS (
+    SELECT 1 FROM PAPS_CATEGORY pc WHERE pc.paps_id = p.id AND pc.category_id = :category_id::uuid
+  ))
   AND (:min_price::numeric IS NULL OR p.payment_amount >= :min_price::numeric)
   AND (:max_price::numeric IS NULL OR p.payment_amount <= :max_price::numeric)
   AND (:payment_type::text IS NULL OR p.payment_type = :payment_type::text)
@@ -743,6 +744,19 @@ JOIN CATEGORY c ON pc.category_id = c.id
 WHERE pc.paps_id = :paps_id::uuid
 ORDER BY pc.is_primary DESC, c.name;
 
+-- Categories of several paps at once, to avoid one query per listed paps
+-- name: get_paps_categories_batch(paps_ids)
+SELECT 
+    pc.paps_id::text,
+    c.id::text as category_id,
+    c.name as category_name,
+    c.slug as category_slug,
+    pc.is_primary
+FROM PAPS_CATEGORY pc
+JOIN CATEGORY c ON pc.category_id = c.id
+WHERE pc.paps_id = ANY(:paps_ids::uuid[])
+ORDER BY pc.is_primary DESC, c.name;
+
 -- ============================================
 -- PAPS STATISTICS QUERIES
 -- ============================================
@@ -1205,6 +1219,10 @@ WHERE id = :payment_id::uuid;
 -- name: delete_payment(payment_id)!
 DELETE FROM PAYMENT WHERE id = :payment_id::uuid;
 
+-- Delete all payments of a paps
+-- name: delete_payments_for_paps(paps_id)!
+DELETE FROM PAYMENT WHERE paps_id = :paps_id::uuid;
+
 -- ============================================
 -- CHAT THREAD QUERIES
 -- ============================================
@@ -125,6 +125,7 @@ export interface AsapCanRateResponse {
 export interface AsapConfirmResponse {
   status: 'completed' | 'pending_confirmation';
   message: string;
+  asap: AsapDetail;
 }
 
 /** 
@@ -29,6 +29,7 @@ export interface LoginRequest {
 /** POST /register response */
 export interface RegisterResponse {
   user_id: UUID;
+  token: string;
 }
 
 /** POST /login response (raw from API) */
@@ -74,7 +74,7 @@ export const commentEndpoints: Record<string, EndpointConfig> = {
    * 
    * Path params: comment_id
    * Request: CommentUpdateRequest { content }
-   * Response: CommentUpdateResponse { message }
+   * Response: CommentUpdateResponse (the updated comment)
    */
   'comments.update': {
     method: 'PUT',
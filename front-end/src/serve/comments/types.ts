@@ -123,12 +123,9 @@ export interface CommentCreateResponse {
 }
 
 /** 
- * PUT /comments/{comment_id} response
+ * PUT /comments/{comment_id} response - the updated comment
  */
-export interface CommentUpdateResponse {
-  /** Success message */
-  message: string;
-}
+export type CommentUpdateResponse = Comment;
 
 /** 
  * DELETE /comments/{comment_id} response
@@ -70,4 +70,11 @@ export const paymentEndpoints: Record<string, EndpointConfig> = {
     auth: true,
     validate: validatePaymentCreate,
   },
+  
+  /** DELETE /paps/{paps_id}/payments - Delete all payments of a PAPS (admin only) */
+  'payments.deleteForPaps': {
+    method: 'DELETE',
+    path: '/paps/{paps_id}/payments',
+    auth: true,
+  },
 };
@@ -124,7 +124,7 @@ export interface SpapApplyResponse {
  * - Deletes the SPAP
  * - If max_assignees reached: closes PAPS and deletes remaining SPAPs
  */
-export interface SpapAcceptResponse {
+export interface SpapAcceptResponse extends SpapDetail {
   asap_id: UUID;
 }
 